@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import stat
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from .core import DatasetSummary
+
+CACHE_DIR = Path.home() / ".cache" / "eda-cli"
+
+# Сессионный кэш живёт в памяти (tmpfs), если она доступна; каталог свой у каждого пользователя
+_SHM = Path("/dev/shm")
+_SESSION_NAME = f"eda-cli-{os.getuid()}" if hasattr(os, "getuid") else "eda-cli"
+SESSION_DIR = (_SHM if _SHM.is_dir() else Path(tempfile.gettempdir())) / _SESSION_NAME
+# Сессии, к которым не обращались дольше суток, удаляются при создании новой
+SESSION_MAX_AGE = 24 * 60 * 60
+
+
+def _path_hash(path: Path) -> str:
+    return hashlib.blake2b(str(path.resolve()).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def cache_key(
+    path: Path,
+    sep: str,
+    encoding: str,
+    st: Optional[os.stat_result] = None,
+) -> str:
+    """
+    Ключ кэша: путь, время изменения и размер файла + параметры чтения.
+    Любое изменение исходного CSV даёт новый ключ.
+    Результат path.stat(), если он уже есть у вызывающего, можно передать в st.
+
+    Ключ начинается с хэша пути ("<путь>-<версия>"): по нему save_cached_frame
+    находит копии, сохранённые для прежних версий того же файла.
+    """
+    if st is None:
+        st = path.stat()
+    raw = f"{st.st_mtime_ns}|{st.st_size}|{sep}|{encoding}"
+    version = hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
+    return f"{_path_hash(path)}-{version}"
+
+
+def load_cached_frame(key: str, cache_dir: Path = CACHE_DIR) -> Optional[pd.DataFrame]:
+    """
+    Возвращает ранее разобранный DataFrame из parquet или None, если кэша нет.
+    """
+    cache_path = cache_dir / f"{key}.parquet"
+    try:
+        return pd.read_parquet(cache_path, dtype_backend="pyarrow")
+    except FileNotFoundError:
+        return None
+    except Exception:  # noqa: BLE001
+        # Битый файл кэша просто игнорируем – CSV будет разобран заново
+        return None
+
+
+def save_cached_frame(df: pd.DataFrame, key: str, cache_dir: Path = CACHE_DIR) -> Optional[Path]:
+    """
+    Сохраняет DataFrame в parquet (zstd). Ошибки записи не критичны и игнорируются.
+    Для ключей cache_key на каждый файл хранится одна копия: копии прежних
+    версий файла удаляются.
+    """
+    cache_path = cache_dir / f"{key}.parquet"
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(tmp_path, compression="zstd")
+        # Атомарная замена: параллельный запуск не увидит недописанный файл
+        os.replace(tmp_path, cache_path)
+    except Exception:  # noqa: BLE001
+        tmp_path.unlink(missing_ok=True)
+        return None
+
+    path_hash, sep, _ = key.partition("-")
+    if sep:
+        try:
+            for stale in cache_dir.glob(f"{path_hash}-*.parquet"):
+                if stale != cache_path:
+                    stale.unlink(missing_ok=True)
+        except OSError:
+            pass
+    return cache_path
+
+
+class SessionCache:
+    """
+    Сессионный кэш для последовательных запусков команд на одном CSV
+    (head -> overview -> report): хранит разобранный DataFrame и производные
+    таблицы (summary, missing, correlation), чтобы не считать их заново.
+
+    Каталог сессии привязан к пути файла; если файл изменился (mtime/размер)
+    или поменялись параметры чтения, старое содержимое удаляется.
+
+    Корень сессий лежит в общем каталоге (/dev/shm), поэтому используется, только
+    если он принадлежит текущему пользователю и закрыт для остальных; иначе
+    сессия отключается (все загрузки – промахи, сохранения ничего не делают).
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        sep: str,
+        encoding: str,
+        root: Path = SESSION_DIR,
+        st: Optional[os.stat_result] = None,
+    ) -> None:
+        self.key = cache_key(path, sep, encoding, st=st)
+        self.root = root
+        self.dir = root / _path_hash(path)
+        self.enabled = self._validate()
+
+    def _root_is_private(self) -> bool:
+        # Каталог с предсказуемым именем мог заранее создать другой пользователь
+        try:
+            st = os.lstat(self.root)
+        except OSError:
+            return False
+        if not stat.S_ISDIR(st.st_mode):  # в т.ч. симлинк
+            return False
+        if hasattr(os, "getuid"):
+            return st.st_uid == os.getuid() and st.st_mode & 0o077 == 0
+        return True
+
+    def _validate(self) -> bool:
+        try:
+            self.root.mkdir(parents=True, mode=0o700, exist_ok=True)
+        except OSError:
+            return False
+        if not self._root_is_private():
+            return False
+
+        key_path = self.dir / "key"
+        try:
+            if key_path.read_text(encoding="utf-8") == self.key:
+                # Отмечаем обращение, чтобы живую сессию не удалили как устаревшую
+                os.utime(key_path)
+                return True
+        except OSError:
+            pass
+        # Сессии нет или она устарела – начинаем с чистого каталога
+        try:
+            shutil.rmtree(self.dir, ignore_errors=True)
+            self.dir.mkdir(mode=0o700)
+            key_path.write_text(self.key, encoding="utf-8")
+        except OSError:
+            return False
+        self._evict_stale()
+        return True
+
+    def _evict_stale(self) -> None:
+        # Сессии живут в памяти (tmpfs), поэтому давно не использованные удаляем
+        deadline = time.time() - SESSION_MAX_AGE
+        try:
+            for other in self.root.iterdir():
+                if other == self.dir:
+                    continue
+                try:
+                    stale = (other / "key").stat().st_mtime < deadline
+                except OSError:
+                    stale = True
+                if stale:
+                    shutil.rmtree(other, ignore_errors=True)
+        except OSError:
+            pass
+
+    def load_frame(self, name: str) -> Optional[pd.DataFrame]:
+        if not self.enabled:
+            return None
+        return load_cached_frame(name, cache_dir=self.dir)
+
+    def save_frame(self, df: pd.DataFrame, name: str) -> Optional[Path]:
+        if not self.enabled:
+            return None
+        return save_cached_frame(df, name, cache_dir=self.dir)
+
+    def load_summary(self) -> Optional[DatasetSummary]:
+        if not self.enabled:
+            return None
+        try:
+            data = json.loads((self.dir / "summary.json").read_text(encoding="utf-8"))
+            return DatasetSummary.from_dict(data)
+        except Exception:  # noqa: BLE001
+            return None
+
+    def save_summary(self, summary: DatasetSummary) -> None:
+        if not self.enabled:
+            return
+        try:
+            (self.dir / "summary.json").write_text(
+                json.dumps(summary.to_dict(), ensure_ascii=False), encoding="utf-8"
+            )
+        except OSError:
+            pass
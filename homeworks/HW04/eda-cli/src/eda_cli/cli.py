@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import multiprocessing
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import Any, Awaitable, Dict, List, Optional
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import typer
 
+from .cache import SessionCache, cache_key, load_cached_frame, save_cached_frame
 from .core import (
     DatasetSummary,
     compute_quality_flags,
@@ -17,41 +27,208 @@ from .core import (
 )
 from .viz import (
     plot_correlation_heatmap,
-    plot_missing_matrix,
+    plot_missing_mask,
     plot_histograms_per_column,
-    save_top_categories_tables,
+    top_categories_table_path,
 )
 
 app = typer.Typer(help="Мини-CLI для EDA CSV-файлов")
 
 
+def _is_utf8(encoding: str) -> bool:
+    return encoding.lower().replace("_", "-") in ("utf-8", "utf8")
+
+
+def _dedup_column_names(names: List[str]) -> List[str]:
+    # Повторяющиеся заголовки переименовываем как pd.read_csv: a, a.1, a.2, ...
+    # (пропуская имена, которые уже есть в заголовке)
+    header = set(names)
+    counts: Dict[str, int] = {}
+    result: List[str] = []
+    for name in names:
+        col = name
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[name] = count + 1
+            col = f"{name}.{count}"
+            count = count + 1 if col in header else counts.get(col, 0)
+        result.append(col)
+        counts[col] = count + 1
+    return result
+
+
+def _temporal_as_string(schema: pa.Schema) -> Dict[str, pa.DataType]:
+    return {f.name: pa.string() for f in schema if pa.types.is_temporal(f.type)}
+
+
+def _read_csv_arrow(path: Path, sep: str, encoding: str) -> pd.DataFrame:
+    # Многопоточный парсер Arrow; колонки остаются Arrow-backed (без копирования в numpy)
+    read_options = pacsv.ReadOptions(encoding=encoding)
+    parse_options = pacsv.ParseOptions(delimiter=sep)
+
+    def convert_options(column_types: Dict[str, pa.DataType]) -> pacsv.ConvertOptions:
+        # Как и pandas, считаем пустые строки в текстовых колонках пропусками
+        return pacsv.ConvertOptions(strings_can_be_null=True, column_types=column_types)
+
+    def source() -> pa.NativeFile:
+        # UTF-8 не нужно перекодировать: парсер читает байты прямо из mmap
+        return pa.memory_map(str(path)) if _is_utf8(encoding) else pa.OSFile(str(path))
+
+    # pd.read_csv не распознаёт даты и оставляет их строками (категориями в отчёте);
+    # pyarrow же выводит для ISO-дат date32/timestamp. Типы он выводит по первому блоку,
+    # поэтому читаем только его схему и сразу задаём таким колонкам тип string
+    with source() as f:
+        column_types = _temporal_as_string(
+            pacsv.open_csv(f, read_options, parse_options, convert_options({})).schema
+        )
+
+    def read(column_types: Dict[str, pa.DataType]) -> pa.Table:
+        with source() as f:
+            return pacsv.read_csv(f, read_options, parse_options, convert_options(column_types))
+
+    table = read(column_types)
+    # Колонка, которая стала датой только после первого блока, – редкий случай: перечитываем
+    late = _temporal_as_string(table.schema)
+    if late:
+        table = read({**column_types, **late})
+    if len(set(table.column_names)) < table.num_columns:
+        table = table.rename_columns(_dedup_column_names(table.column_names))
+    return table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
+
+
+def _read_csv_pandas(path: Path, sep: str, encoding: str, **kwargs: Any) -> pd.DataFrame:
+    # Многосимвольные разделители (regex) поддерживает только python-движок;
+    # C-движок читаем целиком (low_memory=False), без разбиения на куски
+    if len(sep) > 1:
+        kwargs.setdefault("engine", "python")
+    else:
+        kwargs.setdefault("engine", "c")
+        kwargs.setdefault("low_memory", False)
+    return pd.read_csv(
+        path,
+        sep=sep,
+        encoding=encoding,
+        memory_map=True,
+        dtype_backend="pyarrow",
+        **kwargs,
+    )
+
+
+def _stat_csv(path: Path) -> os.stat_result:
+    # Один stat и для проверки существования, и для ключей кэша
+    try:
+        return path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        raise typer.BadParameter(f"Файл '{path}' не найден") from None
+
+
 def _load_csv(
     path: Path,
     sep: str = ",",
     encoding: str = "utf-8",
+    use_cache: bool = True,
+    session: Optional[SessionCache] = None,
+    st: Optional[os.stat_result] = None,
 ) -> pd.DataFrame:
-    if not path.exists():
-        raise typer.BadParameter(f"Файл '{path}' не найден")
+    if st is None:
+        st = _stat_csv(path)
+
+    if session is not None:
+        cached = session.load_frame("frame")
+        if cached is not None:
+            return cached
+
+    # Повторные запуски на том же файле читают готовый parquet вместо разбора CSV
+    key = cache_key(path, sep, encoding, st=st) if use_cache else None
+    df = load_cached_frame(key) if key is not None else None
+
+    if df is None:
+        try:
+            try:
+                df = _read_csv_arrow(path, sep=sep, encoding=encoding)
+            except ValueError:
+                # pyarrow не поддерживает многосимвольные разделители и строки
+                # с "лишними" полями – для таких файлов используем парсер pandas
+                df = _read_csv_pandas(path, sep=sep, encoding=encoding)
+        except Exception as exc:  # noqa: BLE001
+            raise typer.BadParameter(f"Не удалось прочитать CSV: {exc}") from exc
+
+        if key is not None:
+            save_cached_frame(df, key)
+
+    if session is not None:
+        session.save_frame(df, "frame")
+    return df
+
+
+def _load_csv_head(
+    path: Path,
+    n: int,
+    sep: str = ",",
+    encoding: str = "utf-8",
+) -> pd.DataFrame:
+    """
+    Читает только первые n строк, не разбирая остальной файл.
+    """
     try:
-        return pd.read_csv(path, sep=sep, encoding=encoding)
+        return _read_csv_pandas(path, sep=sep, encoding=encoding, nrows=n)
     except Exception as exc:  # noqa: BLE001
         raise typer.BadParameter(f"Не удалось прочитать CSV: {exc}") from exc
 
 
+# Пустые строки (в т.ч. "\r\n") в начале куска и серии пустых строк внутри него
+_LEADING_BLANK_LINES = re.compile(rb"\A(?:\r?\n)+")
+_BLANK_LINE_RUNS = re.compile(rb"\n(?:\r?\n)+")
+
+
+def _count_rows(path: Path) -> int:
+    """
+    Быстрый подсчёт строк данных (без заголовка) по числу переводов строки.
+    Пустые строки, как и pd.read_csv, пропускаются. Кавычки не учитываются,
+    поэтому многострочные значения дадут завышенную оценку.
+    """
+    n_lines = 0
+    at_line_start = True
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            if at_line_start:
+                chunk = _LEADING_BLANK_LINES.sub(b"", chunk)
+                if not chunk:
+                    continue
+            n_lines += _BLANK_LINE_RUNS.sub(b"\n", chunk).count(b"\n")
+            at_line_start = chunk.endswith(b"\n")
+    # Последняя строка без завершающего перевода строки тоже считается
+    if not at_line_start:
+        n_lines += 1
+    return max(n_lines - 1, 0)
+
+
 @app.command()
 def head(
     path: str = typer.Argument(..., help="Путь к CSV-файлу."),
     n: int = typer.Option(5, help="Количество строк для вывода."),
     sep: str = typer.Option(",", help="Разделитель в CSV."),
     encoding: str = typer.Option("utf-8", help="Кодировка файла."),
+    session: bool = typer.Option(False, "--session/--no-session", help="Сохранять разобранный датасет для следующих команд."),
 ) -> None:
     """
     Вывести первые N строк CSV-файла.
     """
-    df = _load_csv(Path(path), sep=sep, encoding=encoding)
-    
+    src = Path(path)
+    st = _stat_csv(src)
+    if session:
+        # Разбираем файл целиком один раз, чтобы overview/report взяли его из сессии
+        session_cache = SessionCache(src, sep, encoding, st=st)
+        # В ~/.cache/eda-cli пишут только overview/report; head хранит датасет лишь в сессии
+        full_df = _load_csv(src, sep=sep, encoding=encoding, use_cache=False, session=session_cache, st=st)
+        df = full_df.head(n)
+        n_rows = len(full_df)
+    else:
+        df = _load_csv_head(src, n, sep=sep, encoding=encoding)
+        # Если прочитано меньше n строк, файл разобран целиком и len(df) – точное число
+        n_rows = len(df) if len(df) < n else _count_rows(src)
+
     # Проверяем, что n не превышает количество строк
-    n_rows = len(df)
     if n > n_rows:
         typer.echo(f"Запрошено {n} строк, но в файле всего {n_rows} строк.")
         typer.echo(f"Будут выведены все {n_rows} строк:\n")
@@ -59,12 +236,12 @@ def head(
     else:
         typer.echo(f"Первые {n} строк из {n_rows}:\n")
     
-    # Выводим первые n строк
-    typer.echo(df.head(n).to_string(index=False))
+    # Выводим первые n строк: пишем TSV прямо в stdout, без сборки одной большой строки
+    df.head(n).to_csv(sys.stdout, sep="\t", index=False, lineterminator="\n")
     
     # Доп. информация
     typer.echo(f"\nВсего строк: {n_rows}, столбцов: {len(df.columns)}")
-    typer.echo(f"Столбцы: {', '.join(df.columns.tolist())}")
+    typer.echo(f"Столбцы: {', '.join(df.columns)}")
 
 
 @app.command()
@@ -72,6 +249,8 @@ def overview(
     path: str = typer.Argument(..., help="Путь к CSV-файлу."),
     sep: str = typer.Option(",", help="Разделитель в CSV."),
     encoding: str = typer.Option("utf-8", help="Кодировка файла."),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Не использовать кэш разобранного CSV."),
+    session: bool = typer.Option(False, "--session/--no-session", help="Переиспользовать датасет и сводку из предыдущих команд."),
 ) -> None:
     """
     Напечатать краткий обзор датасета:
@@ -79,136 +258,237 @@ def overview(
     - типы;
     - простая табличка по колонкам.
     """
-    df = _load_csv(Path(path), sep=sep, encoding=encoding)
-    summary: DatasetSummary = summarize_dataset(df)
+    src = Path(path)
+    st = _stat_csv(src)
+    session_cache = SessionCache(src, sep, encoding, st=st) if session else None
+    summary: Optional[DatasetSummary] = session_cache.load_summary() if session_cache else None
+    if summary is None:
+        df = _load_csv(src, sep=sep, encoding=encoding, use_cache=not no_cache, session=session_cache, st=st)
+        summary = summarize_dataset(df)
+        if session_cache is not None:
+            session_cache.save_summary(summary)
     summary_df = flatten_summary_for_print(summary)
 
     typer.echo(f"Строк: {summary.n_rows}")
     typer.echo(f"Столбцов: {summary.n_cols}")
     typer.echo("\nКолонки:")
-    typer.echo(summary_df.to_string(index=False))
+    summary_df.to_csv(sys.stdout, sep="\t", index=False, lineterminator="\n")
 
 
-@app.command()
-def report(
-    path: str = typer.Argument(..., help="Путь к CSV-файлу."),
-    out_dir: str = typer.Option("reports", help="Каталог для отчёта."),
-    sep: str = typer.Option(",", help="Разделитель в CSV."),
-    encoding: str = typer.Option("utf-8", help="Кодировка файла."),
-    max_hist_columns: int = typer.Option(6, help="Максимум числовых колонок для гистограмм."),
-    top_k_categories: int = typer.Option(5, help="Сколько top-значений выводить для категориальных признаков."),
-    title: str = typer.Option("EDA-отчёт", help="Заголовок отчёта."),
-    min_missing_share: float = typer.Option(0.1, help="Порог доли пропусков для выделения проблемных колонок."),
+async def _report_async(
+    path: str,
+    out_dir: str,
+    sep: str,
+    encoding: str,
+    max_hist_columns: int,
+    top_k_categories: int,
+    title: str,
+    min_missing_share: float,
+    use_cache: bool,
+    session: bool,
 ) -> None:
     """
-    Сгенерировать полный EDA-отчёт:
-    - текстовый overview и summary по колонкам (CSV/Markdown);
-    - статистика пропусков;
-    - корреляционная матрица;
-    - top-k категорий по категориальным признакам;
-    - картинки: гистограммы, матрица пропусков, heatmap корреляции.
+    Тело команды report: каждый артефакт отправляется на запись в фоновый
+    поток (графики – в процессы), как только готовы его данные, поэтому
+    запись идёт параллельно с остальными расчётами и сборкой Markdown.
     """
     out_root = Path(out_dir)
     out_root.mkdir(parents=True, exist_ok=True)
 
-    df = _load_csv(Path(path), sep=sep, encoding=encoding)
+    src = Path(path)
+    st = _stat_csv(src)
+    session_cache = SessionCache(src, sep, encoding, st=st) if session else None
+    df = _load_csv(src, sep=sep, encoding=encoding, use_cache=use_cache, session=session_cache, st=st)
 
-    # 1. Обзор
-    summary = summarize_dataset(df)
-    summary_df = flatten_summary_for_print(summary)
-    missing_df = missing_table(df)
-    corr_df = correlation_matrix(df)
-    top_cats = top_categories(df, max_columns=20, top_k=top_k_categories) # Сколько top-значений выводить для категориальных признаков
-
-    # 2. Качество в целом
-    quality_flags = compute_quality_flags(summary, missing_df)
-    problematic_cols = []
-    if not missing_df.empty:
-        problematic_cols = missing_df[missing_df["missing_share"] >= min_missing_share].index.tolist()
-
-    # 3. Сохраняем табличные артефакты
-    summary_df.to_csv(out_root / "summary.csv", index=False)
-    if not missing_df.empty:
-        missing_df.to_csv(out_root / "missing.csv", index=True)
-    if not corr_df.empty:
-        corr_df.to_csv(out_root / "correlation.csv", index=True)
-    save_top_categories_tables(top_cats, out_root / "top_categories")
-
-    # 4. Markdown-отчёт
-    md_path = out_root / "report.md"
-    with md_path.open("w", encoding="utf-8") as f:
-        f.write(f"# {title}\n\n")
-        f.write(f"Исходный файл: `{Path(path).name}`\n\n")
-        f.write(f"Строк: **{summary.n_rows}**, столбцов: **{summary.n_cols}**\n\n")
-        f.write(f"Параметры генерации:\n")
-        f.write(f"- Макс. гистограмм: **{max_hist_columns}**\n")
-        f.write(f"- Top-K категорий: **{top_k_categories}**\n")
-        f.write(f"- Порог пропусков: **{min_missing_share:.0%}**\n\n")
-
-        f.write("## Качество данных (эвристики)\n\n")
-        f.write(f"- Оценка качества: **{quality_flags['quality_score']:.2f}**\n")
-        f.write(f"- Макс. доля пропусков по колонке: **{quality_flags['max_missing_share']:.2%}**\n")
-        f.write(f"- Слишком мало строк: **{quality_flags['too_few_rows']}**\n")
-        f.write(f"- Слишком много колонок: **{quality_flags['too_many_columns']}**\n")
-        f.write(f"- Слишком много пропусков: **{quality_flags['too_many_missing']}**\n")
-        f.write(f"- Есть константные колонки: **{quality_flags['has_constant_columns']}**\n")
-        f.write(f"- Есть категориальные с высокой кардинальностью: **{quality_flags['has_high_cardinality_categoricals']}**\n")
-        f.write(f"- Есть подозрительные дубликаты ID: **{quality_flags['has_suspicious_id_duplicates']}**\n")
-        f.write(f"- Есть много нулевых значений: **{quality_flags['has_many_zero_values']}**\n\n")
-
-        f.write("## Проблемные колонки\n\n")
-        if problematic_cols:
-            f.write(f"Колонки с долей пропусков ≥ {min_missing_share:.0%}:\n")
-            for col in problematic_cols:
-                missing_share = missing_df.loc[col, "missing_share"]
-                missing_count = missing_df.loc[col, "missing_count"]
-                f.write(f"- **{col}**: {missing_count} пропусков ({missing_share:.2%})\n")
-            f.write("\n")
+    # viz импортирует matplotlib лениво. При fork модуль, импортированный до создания пула,
+    # наследуется процессами отрисовки; при spawn/forkserver каждый процесс импортирует
+    # matplotlib сам, и импорт в родителе был бы лишней тратой
+    if multiprocessing.get_start_method() == "fork":
+        import matplotlib.pyplot  # noqa: F401
+
+    loop = asyncio.get_running_loop()
+    tasks: List[Awaitable[Any]] = []
+
+    # 6. Картинки не зависят от сводок, поэтому запускаем их сразу.
+    # pyplot не потокобезопасен, так что графики рисуются в отдельных процессах.
+    # Аргументы задач пул сериализует (pickle) даже при fork, поэтому каждой задаче
+    # передаём только нужное: числовые колонки и маску пропусков, а не весь датасет.
+    # Все CSV-артефакты пишутся через один пул потоков (to_csv отпускает GIL на записи);
+    # потоки создаются по мере надобности, так что их не больше числа артефактов.
+    with ProcessPoolExecutor(max_workers=3) as plot_pool, ThreadPoolExecutor(max_workers=8) as io_pool:
+
+        def write_csv(frame: pd.DataFrame, out_path: Path, **kwargs: Any) -> None:
+            tasks.append(loop.run_in_executor(io_pool, partial(frame.to_csv, out_path, **kwargs)))
+
+        numeric_df = df.select_dtypes(include="number")
+        tasks += [
+            loop.run_in_executor(
+                plot_pool, partial(plot_histograms_per_column, numeric_df, out_root, max_columns=max_hist_columns)
+            ),
+            loop.run_in_executor(plot_pool, plot_missing_mask, df.isna(), out_root / "missing_matrix.png"),
+            loop.run_in_executor(plot_pool, plot_correlation_heatmap, numeric_df, out_root / "correlation_heatmap.png"),
+        ]
+
+        # 1. Обзор (3. табличные артефакты сохраняем сразу после расчёта).
+        # В режиме сессии сводки берём из предыдущих запусков, если они есть
+        summary: Optional[DatasetSummary] = None
+        missing_df: Optional[pd.DataFrame] = None
+        corr_df: Optional[pd.DataFrame] = None
+        if session_cache is not None:
+            summary = session_cache.load_summary()
+            missing_df = session_cache.load_frame("missing")
+            corr_df = session_cache.load_frame("correlation")
+
+        if summary is None or missing_df is None:
+            # Колонки Arrow-backed: пропуски берутся из null_count, маска isna не нужна
+            summary = summarize_dataset(df)
+            missing_df = missing_table(df)
+            if session_cache is not None:
+                session_cache.save_summary(summary)
+                session_cache.save_frame(missing_df, "missing")
+        if corr_df is None:
+            corr_df = correlation_matrix(df)
+            if session_cache is not None:
+                session_cache.save_frame(corr_df, "correlation")
+
+        summary_df = flatten_summary_for_print(summary)
+        write_csv(summary_df, out_root / "summary.csv", index=False)
+
+        if not missing_df.empty:
+            write_csv(missing_df, out_root / "missing.csv", index=True)
+
+        if not corr_df.empty:
+            write_csv(corr_df, out_root / "correlation.csv", index=True)
+
+        top_cats = top_categories(df, max_columns=20, top_k=top_k_categories) # Сколько top-значений выводить для категориальных признаков
+        top_dir = out_root / "top_categories"
+        top_dir.mkdir(parents=True, exist_ok=True)
+        for name, table in top_cats.items():
+            write_csv(table, top_categories_table_path(top_dir, name), index=False)
+
+        # 2. Качество в целом
+        quality_flags = compute_quality_flags(summary, missing_df)
+        problematic_df = missing_df
+        if not missing_df.empty:
+            problematic_df = missing_df[missing_df["missing_share"] >= min_missing_share]
+
+        # 4. Markdown-отчёт
+        md_path = out_root / "report.md"
+        parts: List[str] = []
+        parts.append(f"# {title}\n\n")
+        parts.append(f"Исходный файл: `{src.name}`\n\n")
+        parts.append(f"Строк: **{summary.n_rows}**, столбцов: **{summary.n_cols}**\n\n")
+        parts.append(f"Параметры генерации:\n")
+        parts.append(f"- Макс. гистограмм: **{max_hist_columns}**\n")
+        parts.append(f"- Top-K категорий: **{top_k_categories}**\n")
+        parts.append(f"- Порог пропусков: **{min_missing_share:.0%}**\n\n")
+
+        parts.append("## Качество данных (эвристики)\n\n")
+        parts.append(f"- Оценка качества: **{quality_flags['quality_score']:.2f}**\n")
+        parts.append(f"- Макс. доля пропусков по колонке: **{quality_flags['max_missing_share']:.2%}**\n")
+        parts.append(f"- Слишком мало строк: **{quality_flags['too_few_rows']}**\n")
+        parts.append(f"- Слишком много колонок: **{quality_flags['too_many_columns']}**\n")
+        parts.append(f"- Слишком много пропусков: **{quality_flags['too_many_missing']}**\n")
+        parts.append(f"- Есть константные колонки: **{quality_flags['has_constant_columns']}**\n")
+        parts.append(f"- Есть категориальные с высокой кардинальностью: **{quality_flags['has_high_cardinality_categoricals']}**\n")
+        parts.append(f"- Есть подозрительные дубликаты ID: **{quality_flags['has_suspicious_id_duplicates']}**\n")
+        parts.append(f"- Есть много нулевых значений: **{quality_flags['has_many_zero_values']}**\n\n")
+
+        parts.append("## Проблемные колонки\n\n")
+        if not problematic_df.empty:
+            parts.append(f"Колонки с долей пропусков ≥ {min_missing_share:.0%}:\n")
+            # Срез уже содержит нужные значения – идём по нему без поиска по меткам
+            for row in problematic_df.itertuples():
+                parts.append(f"- **{row.Index}**: {int(row.missing_count)} пропусков ({row.missing_share:.2%})\n")
+            parts.append("\n")
         else:
-            f.write(f"Нет колонок с долей пропусков ≥ {min_missing_share:.0%}.\n\n")
+            parts.append(f"Нет колонок с долей пропусков ≥ {min_missing_share:.0%}.\n\n")
 
-        f.write("## Колонки\n\n")
-        f.write("См. файл `summary.csv`.\n\n")
+        parts.append("## Колонки\n\n")
+        parts.append("См. файл `summary.csv`.\n\n")
 
-        f.write("## Пропуски\n\n")
+        parts.append("## Пропуски\n\n")
         if missing_df.empty:
-            f.write("Пропусков нет или датасет пуст.\n\n")
+            parts.append("Пропусков нет или датасет пуст.\n\n")
         else:
-            f.write("См. файлы `missing.csv` и `missing_matrix.png`.\n\n")
+            parts.append("См. файлы `missing.csv` и `missing_matrix.png`.\n\n")
 
-        f.write("## Корреляция числовых признаков\n\n")
+        parts.append("## Корреляция числовых признаков\n\n")
         if corr_df.empty:
-            f.write("Недостаточно числовых колонок для корреляции.\n\n")
+            parts.append("Недостаточно числовых колонок для корреляции.\n\n")
         else:
-            f.write("См. `correlation.csv` и `correlation_heatmap.png`.\n\n")
+            parts.append("См. `correlation.csv` и `correlation_heatmap.png`.\n\n")
 
-        f.write("## Категориальные признаки\n\n")
+        parts.append("## Категориальные признаки\n\n")
         if not top_cats:
-            f.write("Категориальные/строковые признаки не найдены.\n\n")
+            parts.append("Категориальные/строковые признаки не найдены.\n\n")
         else:
-            f.write(f"Top-{top_k_categories} значений для категориальных признаков:\n")
+            parts.append(f"Top-{top_k_categories} значений для категориальных признаков:\n")
             for col_name, table in top_cats.items():
-                f.write(f"\n### {col_name}\n\n")
-                # Выводим первые несколько строк таблицы
-                for _, row in table.head().iterrows():
-                    f.write(f"- {row['value']}: {int(row['count'])} ({row['share']:.2%})\n")
-            f.write("\nПолные таблицы см. в папке `top_categories/`.\n\n")
+                parts.append(f"\n### {col_name}\n\n")
+                # Выводим первые несколько строк таблицы (строки собираем векторно, без iterrows)
+                top = table.head()
+                lines = (
+                    "- " + top["value"].astype(str)
+                    + ": " + top["count"].astype(int).astype(str)
+                    + " (" + top["share"].map("{:.2%}".format) + ")\n"
+                )
+                parts.append(lines.str.cat())
+            parts.append("\nПолные таблицы см. в папке `top_categories/`.\n\n")
+
+        parts.append("## Гистограммы числовых колонок\n\n")
+        parts.append(f"Сгенерировано гистограмм: до {max_hist_columns} числовых колонок.\n")
+        parts.append("См. файлы `hist_*.png`.\n")
 
-        f.write("## Гистограммы числовых колонок\n\n")
-        f.write(f"Сгенерировано гистограмм: до {max_hist_columns} числовых колонок.\n")
-        f.write("См. файлы `hist_*.png`.\n")
+        # Весь отчёт пишем одной операцией
+        md_path.write_text("".join(parts), encoding="utf-8")
 
-    # 6. Картинки
-    plot_histograms_per_column(df, out_root, max_columns=max_hist_columns)
-    plot_missing_matrix(df, out_root / "missing_matrix.png")
-    plot_correlation_heatmap(df, out_root / "correlation_heatmap.png")
+        # Дожидаемся записи всех артефактов (и пробрасываем ошибки из фона)
+        await asyncio.gather(*tasks)
 
     typer.echo(f"Отчёт '{title}' сгенерирован в каталоге: {out_root}")
     typer.echo(f"- Основной markdown: {md_path}")
     typer.echo("- Табличные файлы: summary.csv, missing.csv, correlation.csv, top_categories/*.csv")
     typer.echo("- Графики: hist_*.png, missing_matrix.png, correlation_heatmap.png")
-    if problematic_cols:
-        typer.echo(f"- Проблемные колонки (пропуски ≥ {min_missing_share:.0%}): {len(problematic_cols)} шт.")
+    if not problematic_df.empty:
+        typer.echo(f"- Проблемные колонки (пропуски ≥ {min_missing_share:.0%}): {len(problematic_df)} шт.")
+
+
+@app.command()
+def report(
+    path: str = typer.Argument(..., help="Путь к CSV-файлу."),
+    out_dir: str = typer.Option("reports", help="Каталог для отчёта."),
+    sep: str = typer.Option(",", help="Разделитель в CSV."),
+    encoding: str = typer.Option("utf-8", help="Кодировка файла."),
+    max_hist_columns: int = typer.Option(6, help="Максимум числовых колонок для гистограмм."),
+    top_k_categories: int = typer.Option(5, help="Сколько top-значений выводить для категориальных признаков."),
+    title: str = typer.Option("EDA-отчёт", help="Заголовок отчёта."),
+    min_missing_share: float = typer.Option(0.1, help="Порог доли пропусков для выделения проблемных колонок."),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Не использовать кэш разобранного CSV."),
+    session: bool = typer.Option(False, "--session/--no-session", help="Переиспользовать датасет и сводки из предыдущих команд."),
+) -> None:
+    """
+    Сгенерировать полный EDA-отчёт:
+    - текстовый overview и summary по колонкам (CSV/Markdown);
+    - статистика пропусков;
+    - корреляционная матрица;
+    - top-k категорий по категориальным признакам;
+    - картинки: гистограммы, матрица пропусков, heatmap корреляции.
+    """
+    asyncio.run(
+        _report_async(
+            path=path,
+            out_dir=out_dir,
+            sep=sep,
+            encoding=encoding,
+            max_hist_columns=max_hist_columns,
+            top_k_categories=top_k_categories,
+            title=title,
+            min_missing_share=min_missing_share,
+            use_cache=not no_cache,
+            session=session,
+        )
+    )
 
 
 if __name__ == "__main__":
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import warnings
 from dataclasses import dataclass, asdict
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from pandas.api import types as ptypes
 
 
@@ -39,6 +43,121 @@ class DatasetSummary:
             "columns": [c.to_dict() for c in self.columns],
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DatasetSummary":
+        return cls(
+            n_rows=data["n_rows"],
+            n_cols=data["n_cols"],
+            columns=[ColumnSummary(**c) for c in data["columns"]],
+        )
+
+
+def _arrow_column(s: pd.Series) -> Optional[pa.ChunkedArray]:
+    """
+    Arrow-данные колонки без копирования, если колонка Arrow-backed
+    (так CLI читает CSV), иначе None.
+    """
+    if isinstance(s.dtype, pd.ArrowDtype):
+        return s.array.__arrow_array__()
+    return None
+
+
+def _is_numeric(s: pd.Series) -> bool:
+    """
+    Числовая ли колонка. Arrow-колонки True/False считаются числовыми,
+    как и bool-колонки, которые даёт pd.read_csv.
+    """
+    if isinstance(s.dtype, pd.ArrowDtype) and pa.types.is_boolean(s.dtype.pyarrow_dtype):
+        return True
+    return bool(ptypes.is_numeric_dtype(s))
+
+
+def _missing_counts(df: pd.DataFrame) -> Dict[str, int]:
+    """
+    Число пропусков по колонкам. У Arrow-колонок null_count хранится
+    в метаданных массива, поэтому сами данные не сканируются.
+    """
+    counts: Dict[str, int] = {}
+    for name in df.columns:
+        arr = _arrow_column(df[name])
+        counts[name] = arr.null_count if arr is not None else int(df[name].isna().sum())
+    return counts
+
+
+def _unique_and_examples(s: pd.Series, k: int) -> Tuple[int, List[str]]:
+    """
+    Число уникальных (без пропусков) и до k первых уникальных значений строками.
+    Для Arrow-колонки хэширование выполняется один раз: оба ответа берутся
+    из одного pc.unique.
+    """
+    arr = _arrow_column(s)
+    if arr is None:
+        return int(s.nunique(dropna=True)), s.dropna().astype(str).unique()[:k].tolist()
+    uniques = pc.unique(arr)
+    # В Arrow-колонке все значения одного типа: в строки превращаем только k первых
+    # уникальных, а не всю колонку
+    first = uniques.drop_null().slice(0, k)
+    examples = pd.Series(pd.arrays.ArrowExtensionArray(first)).astype(str).tolist()
+    return len(uniques) - uniques.null_count, examples
+
+
+def _to_float(value: Any) -> float:
+    return float("nan") if value is None else float(value)
+
+
+def _arrow_numeric_stats(arr: pa.ChunkedArray) -> Tuple[float, float, float, float]:
+    # Векторные C++-ядра Arrow прямо по буферам колонки, без копии в float64
+    if pa.types.is_boolean(arr.type):
+        arr = arr.cast(pa.int8())
+    min_max = pc.min_max(arr).as_py()
+    return (
+        _to_float(min_max["min"]),
+        _to_float(min_max["max"]),
+        _to_float(pc.mean(arr).as_py()),
+        # std по одному значению не определена: Arrow даёт None, numpy – NaN
+        _to_float(pc.stddev(arr, ddof=1).as_py()),
+    )
+
+
+def _numeric_stats(df: pd.DataFrame) -> Dict[str, Tuple[float, float, float, float]]:
+    """
+    min/max/mean/std для всех числовых колонок сразу. Arrow-колонки считаются
+    ядрами pyarrow.compute; остальные собираются в один 2-D float64-массив,
+    и каждая статистика считается одной numpy-редукцией по оси 0 вместо
+    отдельного вызова pandas на колонку.
+    """
+    stats: Dict[str, Tuple[float, float, float, float]] = {}
+    numeric_cols: List[str] = []
+    for name in df.columns:
+        s = df[name]
+        if not _is_numeric(s):
+            continue
+        arr = _arrow_column(s)
+        if arr is not None and (
+            pa.types.is_integer(arr.type)
+            or pa.types.is_floating(arr.type)
+            or pa.types.is_boolean(arr.type)
+        ):
+            stats[name] = _arrow_numeric_stats(arr)
+        else:
+            numeric_cols.append(name)
+    if not numeric_cols:
+        return stats
+
+    # Пропуски (в т.ч. pd.NA в nullable/Arrow-колонках) превращаются в NaN
+    arr = df[numeric_cols].to_numpy(dtype="float64", na_value=np.nan)
+    with warnings.catch_warnings():
+        # Колонки из одних NaN и std по одному значению дают NaN – это ожидаемо
+        warnings.simplefilter("ignore", RuntimeWarning)
+        mins = np.nanmin(arr, axis=0)
+        maxs = np.nanmax(arr, axis=0)
+        means = np.nanmean(arr, axis=0)
+        stds = np.nanstd(arr, axis=0, ddof=1)
+
+    for j, name in enumerate(numeric_cols):
+        stats[name] = (float(mins[j]), float(maxs[j]), float(means[j]), float(stds[j]))
+    return stats
+
 
 def summarize_dataset(
     df: pd.DataFrame,
@@ -52,37 +171,34 @@ def summarize_dataset(
     - количество уникальных;
     - несколько примерных значений;
     - базовые числовые статистики (для numeric).
+
+    Для Arrow-backed колонок статистики считаются ядрами pyarrow.compute.
     """
     n_rows, n_cols = df.shape
     columns: List[ColumnSummary] = []
 
+    # Словари вместо Series: в цикле по колонкам обходимся без поиска по меткам pandas
+    missing_counts = _missing_counts(df)
+    numeric_stats = _numeric_stats(df) if n_rows > 0 else {}
+
     for name in df.columns:
         s = df[name]
         dtype_str = str(s.dtype)
 
-        non_null = int(s.notna().sum())
-        missing = n_rows - non_null
+        missing = int(missing_counts[name])
+        non_null = n_rows - missing
         missing_share = float(missing / n_rows) if n_rows > 0 else 0.0
-        unique = int(s.nunique(dropna=True))
-
         # Примерные значения выводим как строки
-        examples = (
-            s.dropna().astype(str).unique()[:example_values_per_column].tolist()
-            if non_null > 0
-            else []
-        )
+        unique, examples = _unique_and_examples(s, example_values_per_column)
 
-        is_numeric = bool(ptypes.is_numeric_dtype(s))
+        is_numeric = _is_numeric(s)
         min_val: Optional[float] = None
         max_val: Optional[float] = None
         mean_val: Optional[float] = None
         std_val: Optional[float] = None
 
         if is_numeric and non_null > 0:
-            min_val = float(s.min())
-            max_val = float(s.max())
-            mean_val = float(s.mean())
-            std_val = float(s.std())
+            min_val, max_val, mean_val, std_val = numeric_stats[name]
 
         columns.append(
             ColumnSummary(
@@ -111,7 +227,7 @@ def missing_table(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return pd.DataFrame(columns=["missing_count", "missing_share"])
 
-    total = df.isna().sum()
+    total = pd.Series(_missing_counts(df), index=df.columns, dtype="int64")
     share = total / len(df)
     result = (
         pd.DataFrame(
@@ -149,7 +265,11 @@ def top_categories(
 
     for name in df.columns:
         s = df[name]
-        if ptypes.is_object_dtype(s) or isinstance(s.dtype, pd.CategoricalDtype):
+        if (
+            ptypes.is_object_dtype(s)
+            or ptypes.is_string_dtype(s)
+            or isinstance(s.dtype, pd.CategoricalDtype)
+        ):
             candidate_cols.append(name)
 
     for name in candidate_cols[:max_columns]:
@@ -1,15 +1,23 @@
 from __future__ import annotations
 
 from pathlib import Path
+from types import ModuleType
 from typing import Dict, Iterable, List, Union
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
 PathLike = Union[str, Path]
 
 
+def _pyplot() -> ModuleType:
+    # matplotlib импортируется ~0.5 с, поэтому грузим его только когда действительно рисуем:
+    # head/overview и HTTP-сервис графики не строят и не должны платить за импорт
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
 def _ensure_dir(path: PathLike) -> Path:
     p = Path(path)
     p.mkdir(parents=True, exist_ok=True)
@@ -26,6 +34,7 @@ def plot_histograms_per_column(
     Для числовых колонок строит по отдельной гистограмме.
     Возвращает список путей к PNG.
     """
+    plt = _pyplot()
     out_dir = _ensure_dir(out_dir)
     numeric_df = df.select_dtypes(include="number")
 
@@ -55,23 +64,31 @@ def plot_missing_matrix(df: pd.DataFrame, out_path: PathLike) -> Path:
     """
     Простая визуализация пропусков: где True=пропуск, False=значение.
     """
+    return plot_missing_mask(df.isna(), out_path)
+
+
+def plot_missing_mask(mask: pd.DataFrame, out_path: PathLike) -> Path:
+    """
+    То же, что plot_missing_matrix, но по готовой маске df.isna(): её удобно
+    передавать в другой процесс вместо всего датасета.
+    """
+    plt = _pyplot()
     out_path = Path(out_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    if df.empty:
+    if mask.empty:
         # Рисуем пустой график
         fig, ax = plt.subplots()
         ax.text(0.5, 0.5, "Empty dataset", ha="center", va="center")
         ax.axis("off")
     else:
-        mask = df.isna().values
-        fig, ax = plt.subplots(figsize=(min(12, df.shape[1] * 0.4), 4))
-        ax.imshow(mask, aspect="auto", interpolation="none")
+        fig, ax = plt.subplots(figsize=(min(12, mask.shape[1] * 0.4), 4))
+        ax.imshow(mask.values, aspect="auto", interpolation="none")
         ax.set_xlabel("Columns")
         ax.set_ylabel("Rows")
         ax.set_title("Missing values matrix")
-        ax.set_xticks(range(df.shape[1]))
-        ax.set_xticklabels(df.columns, rotation=90, fontsize=8)
+        ax.set_xticks(range(mask.shape[1]))
+        ax.set_xticklabels(mask.columns, rotation=90, fontsize=8)
         ax.set_yticks([])
 
     fig.tight_layout()
@@ -84,6 +101,7 @@ def plot_correlation_heatmap(df: pd.DataFrame, out_path: PathLike) -> Path:
     """
     Тепловая карта корреляции числовых признаков.
     """
+    plt = _pyplot()
     out_path = Path(out_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -109,6 +127,13 @@ def plot_correlation_heatmap(df: pd.DataFrame, out_path: PathLike) -> Path:
     return out_path
 
 
+def top_categories_table_path(out_dir: PathLike, name: str) -> Path:
+    """
+    Путь к CSV с top-k категориями колонки name.
+    """
+    return Path(out_dir) / f"top_values_{name}.csv"
+
+
 def save_top_categories_tables(
     top_cats: Dict[str, pd.DataFrame],
     out_dir: PathLike,
@@ -119,7 +144,7 @@ def save_top_categories_tables(
     out_dir = _ensure_dir(out_dir)
     paths: List[Path] = []
     for name, table in top_cats.items():
-        out_path = out_dir / f"top_values_{name}.csv"
+        out_path = top_categories_table_path(out_dir, name)
         table.to_csv(out_path, index=False)
         paths.append(out_path)
     return paths
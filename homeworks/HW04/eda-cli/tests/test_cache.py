@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from eda_cli.cache import SessionCache, cache_key, load_cached_frame, save_cached_frame
+from eda_cli.core import summarize_dataset
+
+
+def _touch(path: Path, mtime_ns: int) -> None:
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_cache_key_changes_with_file_and_options(write_csv):
+    path = write_csv()
+    _touch(path, 1_000_000_000)
+    key = cache_key(path, ",", "utf-8")
+
+    assert cache_key(path, ",", "utf-8") == key
+    assert cache_key(path, ";", "utf-8") != key
+    assert cache_key(path, ",", "cp1251") != key
+
+    _touch(path, 2_000_000_000)
+    assert cache_key(path, ",", "utf-8") != key
+
+
+def test_load_cached_frame_misses(tmp_path):
+    assert load_cached_frame("missing", cache_dir=tmp_path) is None
+
+    # Битый файл кэша – тоже промах, а не ошибка
+    (tmp_path / "broken.parquet").write_bytes(b"not a parquet file")
+    assert load_cached_frame("broken", cache_dir=tmp_path) is None
+
+
+def test_save_cached_frame_roundtrip_and_evicts_old_versions(tmp_path, write_csv):
+    cache_dir = tmp_path / "cache"
+    path = write_csv()
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", None]})
+
+    _touch(path, 1_000_000_000)
+    old_key = cache_key(path, ",", "utf-8")
+    save_cached_frame(df, old_key, cache_dir=cache_dir)
+    cached = load_cached_frame(old_key, cache_dir=cache_dir)
+    assert cached is not None
+    assert cached["a"].tolist() == [1, 2]
+    assert cached["b"].isna().tolist() == [False, True]
+
+    # Новая версия файла вытесняет копию прежней
+    _touch(path, 2_000_000_000)
+    new_key = cache_key(path, ",", "utf-8")
+    save_cached_frame(df, new_key, cache_dir=cache_dir)
+    assert sorted(p.name for p in cache_dir.iterdir()) == [f"{new_key}.parquet"]
+    assert load_cached_frame(old_key, cache_dir=cache_dir) is None
+
+
+def test_session_cache_misses_until_saved(tmp_path, write_csv):
+    path = write_csv()
+    session = SessionCache(path, ",", "utf-8", root=tmp_path / "session")
+
+    assert session.load_frame("frame") is None
+    assert session.load_summary() is None
+
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", None]})
+    summary = summarize_dataset(df)
+    session.save_frame(df, "frame")
+    session.save_summary(summary)
+
+    reopened = SessionCache(path, ",", "utf-8", root=tmp_path / "session")
+    assert reopened.load_frame("frame") is not None
+    assert reopened.load_summary() == summary
+    # Сохранён только frame – остальные таблицы по-прежнему промах
+    assert reopened.load_frame("missing") is None
+
+
+def test_session_cache_wiped_when_file_or_options_change(tmp_path, write_csv):
+    path = write_csv()
+    root = tmp_path / "session"
+    df = pd.DataFrame({"a": [1, 2]})
+
+    _touch(path, 1_000_000_000)
+    session = SessionCache(path, ",", "utf-8", root=root)
+    session.save_frame(df, "frame")
+    session.save_summary(summarize_dataset(df))
+
+    # Другой разделитель – другая сессия
+    other_sep = SessionCache(path, ";", "utf-8", root=root)
+    assert other_sep.dir == session.dir
+    assert other_sep.load_frame("frame") is None
+    assert other_sep.load_summary() is None
+
+    SessionCache(path, ",", "utf-8", root=root).save_frame(df, "frame")
+    _touch(path, 2_000_000_000)
+    changed = SessionCache(path, ",", "utf-8", root=root)
+    assert changed.load_frame("frame") is None
+    assert sorted(p.name for p in changed.dir.iterdir()) == ["key"]
+
+
+def test_session_cache_disabled_for_foreign_root(tmp_path, write_csv):
+    path = write_csv()
+    df = pd.DataFrame({"a": [1, 2]})
+
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o755)
+    target = tmp_path / "target"
+    target.mkdir(mode=0o700)
+    link = tmp_path / "link"
+    link.symlink_to(target)
+
+    # Корень доступен другим пользователям или подменён симлинком – сессия выключена
+    for root in (shared, link):
+        session = SessionCache(path, ",", "utf-8", root=root)
+        assert not session.enabled
+        session.save_frame(df, "frame")
+        session.save_summary(summarize_dataset(df))
+        assert session.load_frame("frame") is None
+        assert session.load_summary() is None
+    assert list(shared.iterdir()) == []
+    assert list(target.iterdir()) == []
+
+
+def test_session_cache_evicts_stale_sessions(tmp_path, write_csv):
+    root = tmp_path / "session"
+    old = SessionCache(write_csv(name="old.csv"), ",", "utf-8", root=root)
+    recent = SessionCache(write_csv(name="recent.csv"), ",", "utf-8", root=root)
+    _touch(old.dir / "key", 1_000_000_000)
+
+    SessionCache(write_csv(name="new.csv"), ",", "utf-8", root=root)
+    assert not old.dir.exists()
+    assert recent.dir.exists()
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import io
+from functools import partial
+
+import pandas as pd
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from eda_cli.cache import SessionCache
+from eda_cli.cli import _count_rows, _read_csv_arrow, _stat_csv, app
+from eda_cli.core import missing_table, summarize_dataset, top_categories
+
+
+def test_read_csv_arrow_matches_pandas_semantics(write_csv):
+    path = write_csv(
+        "flag,day,ts\n"
+        "True,2024-01-01,2024-01-01 10:00\n"
+        "False,2024-01-02,2024-01-02 11:00\n"
+        "True,2024-01-01,2024-01-01 10:00\n",
+    )
+    df = _read_csv_arrow(path, sep=",", encoding="utf-8")
+    base = pd.read_csv(path)
+
+    # Даты остаются строками в исходном виде, как у pd.read_csv
+    assert df["day"].tolist() == base["day"].tolist()
+    assert df["ts"].tolist() == base["ts"].tolist()
+    assert {"day", "ts"} <= set(top_categories(df))
+
+    # True/False – числовая колонка со статистиками, как bool у pandas
+    flag = {c.name: c for c in summarize_dataset(df).columns}["flag"]
+    base_flag = {c.name: c for c in summarize_dataset(base).columns}["flag"]
+    assert flag.is_numeric and base_flag.is_numeric
+    assert (flag.min, flag.max) == (base_flag.min, base_flag.max) == (0.0, 1.0)
+    assert abs(flag.mean - base_flag.mean) < 1e-12
+    assert abs(flag.std - base_flag.std) < 1e-12
+
+
+def test_count_rows_skips_blank_lines(write_csv):
+    assert _count_rows(write_csv("a,b\n1,x\n2,y\n\n\n")) == 2
+    assert _count_rows(write_csv("\r\na,b\r\n1,x\r\n\r\n2,y")) == 2
+    assert _count_rows(write_csv("a,b\n")) == 0
+
+
+def test_head_reports_exact_row_count(write_csv):
+    path = write_csv("a,b\n1,x\n2,y\n\n\n")
+    result = CliRunner().invoke(app, ["head", str(path), "--n", "5"])
+
+    assert result.exit_code == 0, result.output
+    assert "в файле всего 2 строк" in result.output
+    assert "Всего строк: 2, столбцов: 2" in result.output
+
+
+def test_summarize_arrow_empty_columns(write_csv):
+    # pyarrow даёт тип null пустой колонке и всем колонкам файла из одного заголовка
+    for text, n_rows in (("a,b,empty\n1,x,\n2,y,\n3,,\n", 3), ("a,b,empty\n", 0)):
+        df = _read_csv_arrow(write_csv(text), sep=",", encoding="utf-8")
+        empty = {c.name: c for c in summarize_dataset(df).columns}["empty"]
+
+        assert (empty.non_null, empty.missing, empty.unique) == (0, n_rows, 0)
+        assert empty.example_values == []
+        if n_rows:
+            assert int(missing_table(df).loc["empty", "missing_count"]) == n_rows
+
+
+def test_read_csv_arrow_renames_duplicate_headers(write_csv):
+    path = write_csv("a,a,b,a.1,a\n1,2,x,3,4\n")
+    df = _read_csv_arrow(path, sep=",", encoding="utf-8")
+    assert list(df.columns) == list(pd.read_csv(path).columns)
+
+    result = CliRunner().invoke(app, ["overview", str(path), "--no-cache"])
+    assert result.exit_code == 0, result.output
+    assert "Столбцов: 5" in result.output
+
+
+def test_stat_csv_reports_missing_file(write_csv):
+    path = write_csv()
+    for missing in (path.with_name("nope.csv"), path / "x"):
+        with pytest.raises(typer.BadParameter, match="не найден"):
+            _stat_csv(missing)
+
+
+_REPORT_CSV = "id,city,score,amount\n1,A,1.5,10\n2,A,,20\n3,B,,15\n4,A,2.5,30\n5,,3.0,25\n"
+
+
+def test_overview_prints_summary_as_tsv(write_csv):
+    result = CliRunner().invoke(app, ["overview", str(write_csv(_REPORT_CSV)), "--no-cache"])
+    assert result.exit_code == 0, result.output
+    assert result.output.startswith("Строк: 5\nСтолбцов: 4\n\nКолонки:\n")
+
+    table = pd.read_csv(io.StringIO(result.output.split("Колонки:\n", 1)[1]), sep="\t")
+    assert table["name"].tolist() == ["id", "city", "score", "amount"]
+    assert table["missing"].tolist() == [0, 1, 2, 0]
+    assert table["is_numeric"].tolist() == [True, False, True, True]
+    assert table.loc[2, "mean"] == pytest.approx(7 / 3)
+
+
+def test_report_writes_artifacts_and_markdown(tmp_path, write_csv):
+    out_dir = tmp_path / "out"
+    result = CliRunner().invoke(
+        app, ["report", str(write_csv(_REPORT_CSV)), "--out-dir", str(out_dir), "--no-cache"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "Проблемные колонки (пропуски ≥ 10%): 2 шт." in result.output
+
+    for name in (
+        "report.md",
+        "summary.csv",
+        "missing.csv",
+        "correlation.csv",
+        "missing_matrix.png",
+        "correlation_heatmap.png",
+        "hist_1_id.png",
+        "hist_2_score.png",
+        "hist_3_amount.png",
+        "top_categories/top_values_city.csv",
+    ):
+        assert (out_dir / name).is_file(), name
+
+    report = (out_dir / "report.md").read_text(encoding="utf-8")
+    assert report.startswith("# EDA-отчёт\n\nИсходный файл: `data.csv`\n\nСтрок: **5**, столбцов: **4**\n")
+    assert (
+        "## Проблемные колонки\n\n"
+        "Колонки с долей пропусков ≥ 10%:\n"
+        "- **score**: 2 пропусков (40.00%)\n"
+        "- **city**: 1 пропусков (20.00%)\n\n"
+    ) in report
+    assert "### city\n\n- A: 3 (75.00%)\n- B: 1 (25.00%)\n" in report
+
+
+def test_head_session_does_not_write_parquet_cache(tmp_path, write_csv, monkeypatch):
+    saved = []
+    monkeypatch.setattr("eda_cli.cli.save_cached_frame", lambda *args, **kwargs: saved.append(args))
+    monkeypatch.setattr("eda_cli.cli.SessionCache", partial(SessionCache, root=tmp_path / "session"))
+
+    result = CliRunner().invoke(app, ["head", str(write_csv(_REPORT_CSV)), "--session"])
+    assert result.exit_code == 0, result.output
+    assert saved == []
+    # Датасет сохранён только в сессии
+    assert len(list((tmp_path / "session").glob("*/frame.parquet"))) == 1
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import pandas as pd
+import pyarrow as pa
 
 from eda_cli.core import (
+    DatasetSummary,
     compute_quality_flags,
     correlation_matrix,
     flatten_summary_for_print,
@@ -167,3 +169,71 @@ def test_quality_flags_mixed_scenario():
     # Проверяем, что только статус отмечен как константная колонка
     assert "status" in flags["constant_columns"]
     assert len(flags["constant_columns"]) == 1
+
+
+def test_top_categories_arrow_backed_strings():
+    # Так колонки выглядят после чтения CSV через pyarrow
+    df = _sample_df().convert_dtypes(dtype_backend="pyarrow")
+    top_cats = top_categories(df, max_columns=5, top_k=2)
+
+    assert "city" in top_cats
+    assert top_cats["city"].iloc[0]["value"] == "A"
+    assert int(top_cats["city"].iloc[0]["count"]) == 2
+
+
+def test_summarize_dataset_numeric_stats_match_pandas():
+    df = pd.DataFrame(
+        {
+            "ints": pd.array([1, None, 3, 10], dtype="Int64"),
+            "floats": [1.5, 2.5, None, -4.0],
+            "empty": [None, None, None, None],
+        }
+    ).astype({"empty": "float64"})
+    by_name = {c.name: c for c in summarize_dataset(df).columns}
+
+    for name in ("ints", "floats"):
+        s = df[name]
+        col = by_name[name]
+        assert col.min == float(s.min())
+        assert col.max == float(s.max())
+        assert abs(col.mean - float(s.mean())) < 1e-12
+        assert abs(col.std - float(s.std())) < 1e-12
+
+    # Колонка без значений: статистики не считаются
+    assert by_name["empty"].is_numeric
+    assert by_name["empty"].min is None
+
+
+def test_summarize_dataset_arrow_single_value():
+    # std по одному значению: numpy даёт NaN, Arrow – pd.NA
+    df = pd.DataFrame({"x": [1.0, None]}).convert_dtypes(dtype_backend="pyarrow")
+    col = summarize_dataset(df).columns[0]
+
+    assert col.is_numeric
+    assert col.min == col.max == 1.0
+    assert col.std != col.std  # NaN
+
+
+def test_dataset_summary_dict_roundtrip():
+    summary = summarize_dataset(_sample_df())
+    assert DatasetSummary.from_dict(summary.to_dict()) == summary
+
+
+def test_summarize_and_missing_arrow_match_numpy():
+    df = _sample_df()
+    # numpy bool у pandas и bool[pyarrow] в Arrow – обе числовые
+    df["flag"] = [True, False, False, True]
+    # Как в CLI: колонки сохраняют типы, но хранятся в Arrow
+    arrow_df = pa.Table.from_pandas(df).to_pandas(types_mapper=pd.ArrowDtype)
+
+    base = summarize_dataset(df)
+    arrow = summarize_dataset(arrow_df)
+    for a, b in zip(base.columns, arrow.columns):
+        assert (a.missing, a.unique, a.example_values) == (b.missing, b.unique, b.example_values)
+        assert a.is_numeric == b.is_numeric
+        if a.is_numeric:
+            assert (a.min, a.max) == (b.min, b.max)
+            assert abs(a.mean - b.mean) < 1e-12
+            assert abs(a.std - b.std) < 1e-12
+
+    pd.testing.assert_frame_equal(missing_table(df), missing_table(arrow_df))